@@ -1,7 +1,10 @@
 ﻿using UglyToad.PdfPig;
+using UglyToad.PdfPig.Core;
 using ClosedXML.Excel;
 using System.Text;
 using System.Diagnostics;
+using System.Collections.Concurrent;
+using Tesseract;
 
 namespace RTUPointlistParse
 {
@@ -22,6 +25,22 @@ namespace RTUPointlistParse
         private const int MIN_SECOND_COLUMN_INDEX = 80;  // Minimum row index indicating second column
         private const int MIN_CHAR_POSITION = 50;        // Minimum character position for second column split
 
+        // Lines shorter than this (after trimming) are never data rows
+        private const int MIN_LINE_LENGTH = 10;
+
+        // Consecutive pages without point rows after which the rest of a PDF is not read
+        private const int MAX_TRAILING_PAGES_WITHOUT_ROWS = 2;
+
+        // Fraction an embedded scan image's edges (and horizontal vs vertical resolution) may be off
+        // the page's and still be OCR'd directly instead of rendering the page with pdftoppm
+        private const double PAGE_IMAGE_MATCH_TOLERANCE = 0.02;
+
+        // Resolution used when rendering PDF pages for OCR (the point list tables use large print)
+        private const int OCR_RENDER_DPI = 150;
+
+        // Average non-whitespace characters per page below which a text layer without point rows is OCR'd
+        private const int MIN_TEXT_CHARS_PER_PAGE = 100;
+
         // Cached Regex patterns for better performance
         private static readonly System.Text.RegularExpressions.Regex DataRowPattern = 
             new System.Text.RegularExpressions.Regex(@"^\d+\s*[|\[]", 
@@ -41,6 +60,15 @@ namespace RTUPointlistParse
         private static readonly System.Text.RegularExpressions.Regex TrailingSingleLetterPattern =
             new System.Text.RegularExpressions.Regex(@"\s+[A-Z]$",
                 System.Text.RegularExpressions.RegexOptions.Compiled);
+        private static readonly System.Text.RegularExpressions.Regex PointNameStopMarkerPattern =
+            new System.Text.RegularExpressions.Regex(@"95-|/AT|RK",
+                System.Text.RegularExpressions.RegexOptions.Compiled);
+        private static readonly System.Text.RegularExpressions.Regex MetadataLinePattern =
+            new System.Text.RegularExpressions.Regex(@"PLOT BY:|_PROJECTS\\|\.dwg|DIAG|INTERPOSNG|RELAY NO\.",
+                System.Text.RegularExpressions.RegexOptions.Compiled);
+        private static readonly System.Text.RegularExpressions.Regex MetadataPointNamePattern =
+            new System.Text.RegularExpressions.Regex(@"LISTING|CONSTRUCTION|ADDED POINT|SYSTEM|REFERENCE|SAP|PLOT BY|^RESERVED FOR",
+                System.Text.RegularExpressions.RegexOptions.Compiled);
         
         // OCR artifact patterns
         private static readonly HashSet<string> OcrNoisePatterns = new HashSet<string>(StringComparer.OrdinalIgnoreCase)
@@ -48,6 +76,33 @@ namespace RTUPointlistParse
             "I", "F", "J", "L", "—", "=", "DI", "or"
         };
         private static readonly char[] LeadingOcrArtifacts = new[] { 'l', 'f', 'I' };
+        private static readonly char[] OcrSeparatorChars = new[] { '|', '[', ']', '(', ')', '{', '}', '_' };
+
+        // Tokens that end a point name (state keywords, control markers and table separators)
+        private static readonly HashSet<string> PointNameStopTokens = new HashSet<string>(StringComparer.Ordinal)
+        {
+            "CLOSE", "OPEN", "NORMAL", "ALARM", "AUTO", "SOLID", "MANUAL", "auto",
+            "[or", "[ot", "[pI", "[oI", "[dI", "DI", "[", "]", "=", "—"
+        };
+
+        // Separators used when splitting lines into tokens
+        private static readonly char[] TokenSeparators = new[] { ' ', '\t' };
+
+        // Loaded Tesseract engines, reused across PDFs (an engine must only be used by one thread at a time)
+        private static readonly ConcurrentBag<TesseractEngine> TesseractEnginePool = new ConcurrentBag<TesseractEngine>();
+        private static volatile bool tesseractEngineUnavailable;
+
+        // Page-level OCR workers running across all PDFs, limited to one per core
+        // (each PDF being OCR'd holds one, and takes more only while they are free)
+        private static readonly SemaphoreSlim OcrWorkerSlots = new SemaphoreSlim(Environment.ProcessorCount);
+        // True when several PDFs (and therefore several tesseract processes) are processed at once
+        private static bool pdfsProcessedConcurrently;
+
+        // Result of the PDF being processed on the current worker, used to buffer its messages
+        private static readonly AsyncLocal<PdfParseResult?> CurrentPdfResult = new AsyncLocal<PdfParseResult?>();
+
+        // Paths of command-line tools found by probing (null if not found), keyed by tool name
+        private static readonly ConcurrentDictionary<string, string?> ToolPathCache = new ConcurrentDictionary<string, string?>();
 
         public static void Main(string[] args)
         {
@@ -75,8 +130,17 @@ namespace RTUPointlistParse
                 Console.WriteLine($"Created output folder: {outputFolder}");
             }
 
-            // Enumerate all PDF files in the input folder
-            var pdfFiles = Directory.GetFiles(inputFolder, "*.pdf");
+            // Enumerate all PDF files in the input folder in one directory walk
+            // Sorted by name so the combined output does not depend on file system order,
+            // and matched case-insensitively so ".PDF" files are found on every platform
+            var enumerationOptions = new EnumerationOptions
+            {
+                MatchCasing = MatchCasing.CaseInsensitive,
+                AttributesToSkip = 0
+            };
+            var pdfFiles = Directory.EnumerateFiles(inputFolder, "*.pdf", enumerationOptions)
+                .OrderBy(f => Path.GetFileName(f), StringComparer.OrdinalIgnoreCase)
+                .ToArray();
             Console.WriteLine($"Found {pdfFiles.Length} PDF file(s) to process");
             Console.WriteLine();
 
@@ -94,51 +158,49 @@ namespace RTUPointlistParse
             var allStatusRows = new List<TableRow>();
             var allAnalogRows = new List<TableRow>();
 
-            // Process each PDF file
-            foreach (var pdfFile in pdfFiles)
+            // Process the PDF files in parallel - each file is extracted, OCR'd and parsed independently.
+            // Results are stored by index so the combined output keeps the input file order.
+            var results = new PdfParseResult[pdfFiles.Length];
+            pdfsProcessedConcurrently = pdfFiles.Length > 1 && Environment.ProcessorCount > 1;
+            var parallelOptions = new ParallelOptions { MaxDegreeOfParallelism = Environment.ProcessorCount };
+            Parallel.For(0, pdfFiles.Length, parallelOptions, i =>
             {
-                try
+                results[i] = ProcessPdfFile(pdfFiles[i]);
+            });
+
+            // All OCR is done - release the loaded language models
+            DisposeTesseractEngines();
+
+            Console.WriteLine();
+            foreach (var result in results)
+            {
+                Console.WriteLine($"{result.FileName}:");
+
+                // Messages buffered by the worker, printed here so parallel files do not interleave
+                foreach (var message in result.Messages)
                 {
-                    Console.WriteLine($"Processing: {Path.GetFileName(pdfFile)}");
-                    
-                    // Extract text from PDF
-                    string pdfText = ExtractTextFromPdf(pdfFile);
-                    
-                    if (string.IsNullOrWhiteSpace(pdfText))
-                    {
-                        Console.WriteLine($"  Warning: No text extracted from PDF. The PDF may be image-based.");
-                    }
-                    else
-                    {
-                        // Determine type based on filename
-                        string fileName = Path.GetFileNameWithoutExtension(pdfFile).ToLower();
-                        
-                        if (fileName.Contains("sh1") || fileName.Contains("status"))
-                        {
-                            // Parse as Status data
-                            var tableRows = ParseStatusTable(pdfText);
-                            allStatusRows.AddRange(tableRows);
-                            Console.WriteLine($"  Extracted {tableRows.Count} Status rows");
-                        }
-                        else if (fileName.Contains("sh2") || fileName.Contains("analog"))
-                        {
-                            // Parse as Analog data
-                            var tableRows = ParseAnalogTable(pdfText);
-                            allAnalogRows.AddRange(tableRows);
-                            Console.WriteLine($"  Extracted {tableRows.Count} Analog rows");
-                        }
-                        else
-                        {
-                            // Unknown type - try to parse as status
-                            var tableRows = ParseStatusTable(pdfText);
-                            allStatusRows.AddRange(tableRows);
-                            Console.WriteLine($"  Extracted {tableRows.Count} rows (assumed Status)");
-                        }
-                    }
+                    Console.WriteLine(message);
+                }
+
+                if (result.Error != null)
+                {
+                    Console.WriteLine($"  Error processing {result.FileName}: {result.Error}");
                 }
-                catch (Exception ex)
+                else if (!result.HasText)
                 {
-                    Console.WriteLine($"  Error processing {Path.GetFileName(pdfFile)}: {ex.Message}");
+                    Console.WriteLine($"  Warning: No text extracted from PDF. The PDF may be image-based.");
+                }
+                else if (result.SheetType == SheetType.Analog)
+                {
+                    allAnalogRows.AddRange(result.Rows);
+                    Console.WriteLine($"  Extracted {result.Rows.Count} Analog rows");
+                }
+                else
+                {
+                    allStatusRows.AddRange(result.Rows);
+                    Console.WriteLine(result.IsSheetTypeAssumed
+                        ? $"  Extracted {result.Rows.Count} rows (assumed Status)"
+                        : $"  Extracted {result.Rows.Count} Status rows");
                 }
             }
 
@@ -171,80 +233,230 @@ namespace RTUPointlistParse
         }
 
         /// <summary>
-        /// Extract text content from a PDF file, using OCR if necessary
+        /// Extract, classify and parse a single PDF file
+        /// Safe to run concurrently for different files
         /// </summary>
-        public static string ExtractTextFromPdf(string filePath)
+        private static PdfParseResult ProcessPdfFile(string pdfFile)
         {
-            var sb = new StringBuilder();
+            var result = new PdfParseResult { FileName = Path.GetFileName(pdfFile) };
+
+            // Route messages from this file's extraction, OCR and parsing into the result
+            // (flows into any page-level OCR workers started below)
+            CurrentPdfResult.Value = result;
 
             try
             {
-                // First, try direct text extraction using PdfPig
-                using (var document = PdfDocument.Open(filePath))
+                Console.WriteLine($"Processing: {result.FileName}");
+
+                // Extract text from PDF, page by page
+                var pageTexts = ExtractPageTextsFromPdf(pdfFile);
+                if (pageTexts.All(string.IsNullOrWhiteSpace))
+                    return result;
+
+                result.HasText = true;
+
+                // Determine type based on filename
+                string fileName = Path.GetFileNameWithoutExtension(pdfFile).ToLower();
+
+                if (fileName.Contains("sh1") || fileName.Contains("status"))
                 {
-                    foreach (var page in document.GetPages())
-                    {
-                        sb.AppendLine(page.Text);
-                    }
+                    // Parse as Status data
+                    result.SheetType = SheetType.Status;
+                    result.Rows = ParseStatusTable(pageTexts);
                 }
-
-                // If no text was extracted, try OCR
-                if (string.IsNullOrWhiteSpace(sb.ToString()))
+                else if (fileName.Contains("sh2") || fileName.Contains("analog"))
                 {
-                    Console.WriteLine($"  No text found, attempting OCR...");
-                    var ocrText = ExtractTextFromPdfWithOcr(filePath);
-                    sb.Clear();
-                    sb.Append(ocrText);
+                    // Parse as Analog data
+                    result.SheetType = SheetType.Analog;
+                    result.Rows = ParseAnalogTable(pageTexts);
+                }
+                else
+                {
+                    // Unknown type - try to parse as status
+                    result.SheetType = SheetType.Status;
+                    result.IsSheetTypeAssumed = true;
+                    result.Rows = ParseStatusTable(pageTexts);
                 }
             }
             catch (Exception ex)
             {
-                Console.WriteLine($"  Error extracting text: {ex.Message}");
+                result.Error = ex.Message;
+            }
+            finally
+            {
+                CurrentPdfResult.Value = null;
+            }
+
+            return result;
+        }
+
+        /// <summary>
+        /// Write a diagnostic message for the PDF currently being processed
+        /// Buffered in that file's result while processing in parallel, written to the console otherwise
+        /// </summary>
+        private static void LogMessage(string message)
+        {
+            var result = CurrentPdfResult.Value;
+            if (result == null)
+            {
+                Console.WriteLine(message);
+                return;
+            }
+
+            lock (result.Messages)
+            {
+                result.Messages.Add(message);
+            }
+        }
+
+        /// <summary>
+        /// Extract text content from a PDF file, using OCR if necessary
+        /// </summary>
+        public static string ExtractTextFromPdf(string filePath)
+        {
+            var sb = new StringBuilder();
+
+            foreach (var pageText in ExtractPageTextsFromPdf(filePath))
+            {
+                sb.AppendLine(pageText);
             }
 
             return sb.ToString();
         }
 
         /// <summary>
-        /// Check if a command-line tool is available in the system PATH
+        /// Extract the text of each page of a PDF file, using OCR if necessary
+        /// Pages are kept as separate strings so they can be parsed without joining the whole document
         /// </summary>
-        private static bool IsToolAvailable(string toolName)
+        public static List<string> ExtractPageTextsFromPdf(string filePath)
         {
+            var pageTexts = new List<string>();
+
             try
             {
-                var process = new Process
+                // First, try direct text extraction using PdfPig
+                using (var document = PdfDocument.Open(filePath))
                 {
-                    StartInfo = new ProcessStartInfo
+                    bool foundPointRows = false;
+                    int pagesWithoutRows = 0;
+
+                    foreach (var page in document.GetPages())
                     {
-                        FileName = toolName,
-                        Arguments = "--version",
-                        RedirectStandardOutput = true,
-                        RedirectStandardError = true,
-                        UseShellExecute = false,
-                        CreateNoWindow = true
+                        string pageText = page.Text;
+                        pageTexts.Add(pageText);
+
+                        // Once the point table has ended (several pages in a row with neither point rows
+                        // nor the table header), the remaining pages are appendices/legends - stop reading.
+                        // Rows are found with the parser that builds the output, so this does not depend
+                        // on how PdfPig breaks the page text into lines
+                        if (ParsePointTable(new[] { pageText }).Count > 0)
+                        {
+                            foundPointRows = true;
+                            pagesWithoutRows = 0;
+                        }
+                        else if (pageText.Contains("POINT NAME"))
+                        {
+                            pagesWithoutRows = 0;
+                        }
+                        else if (foundPointRows && ++pagesWithoutRows >= MAX_TRAILING_PAGES_WITHOUT_ROWS)
+                        {
+                            LogMessage($"  No point rows on the last {pagesWithoutRows} page(s), skipping remaining pages");
+                            break;
+                        }
                     }
-                };
-                process.Start();
-                process.WaitForExit();
-                // Both exit code 0 (success) and 1 (some tools like pdftoppm) are acceptable
-                // as they indicate the tool exists and responded
-                return process.ExitCode == 0 || process.ExitCode == 1;
+
+                    // Born-digital PDFs have a real text layer; scans have none or only a few stray characters.
+                    // Only OCR when the text layer is too sparse to be the point list (e.g. just a plot stamp
+                    // on every page) and has no point rows
+                    int textCharCount = pageTexts.Sum(CountNonWhitespaceChars);
+                    if (textCharCount < MIN_TEXT_CHARS_PER_PAGE * Math.Max(1, pageTexts.Count) && !foundPointRows)
+                    {
+                        LogMessage(textCharCount == 0
+                            ? $"  No text found, attempting OCR..."
+                            : $"  Only {textCharCount} text character(s) found, attempting OCR...");
+                        var ocrText = ExtractTextFromPdfWithOcr(filePath, document);
+
+                        // The text layer is exact, so only replace its stray characters when OCR found point rows
+                        if (textCharCount == 0 || ParsePointTable(new[] { ocrText }).Count > 0)
+                        {
+                            pageTexts.Clear();
+                            pageTexts.Add(ocrText);
+                        }
+                    }
+                }
             }
-            catch (System.ComponentModel.Win32Exception)
+            catch (Exception ex)
             {
-                // Tool not found in PATH (common on Windows)
-                return false;
+                LogMessage($"  Error extracting text: {ex.Message}");
             }
-            catch (FileNotFoundException)
+
+            return pageTexts;
+        }
+
+        /// <summary>
+        /// Count the characters of a text that are not whitespace
+        /// </summary>
+        private static int CountNonWhitespaceChars(string text)
+        {
+            int count = 0;
+            foreach (char c in text)
             {
-                // Tool executable not found
-                return false;
+                if (!char.IsWhiteSpace(c))
+                    count++;
             }
-            catch (Exception)
+            return count;
+        }
+
+        /// <summary>
+        /// Check if a command-line tool is available in the system PATH
+        /// The result is cached so each tool is only probed once per run
+        /// </summary>
+        private static bool IsToolAvailable(string toolName)
+        {
+            return FindToolPath(toolName) != null;
+        }
+
+        /// <summary>
+        /// Get the full path of a command-line tool's executable, or null if it is not installed
+        /// The result is cached so each tool is only probed once per run
+        /// </summary>
+        private static string? FindToolPath(string toolName)
+        {
+            return ToolPathCache.GetOrAdd(toolName, ProbeTool);
+        }
+
+        /// <summary>
+        /// Look for a command-line tool's executable where Process.Start would find it
+        /// Only checks that the file exists, so no process has to be started
+        /// </summary>
+        private static string? ProbeTool(string toolName)
+        {
+            var directories = new List<string>();
+
+            // Process.Start without shell execute only launches .exe files on Windows (not .cmd/.bat shims),
+            // searching the application, current, system and Windows directories before PATH
+            string fileName = toolName;
+            if (OperatingSystem.IsWindows())
             {
-                // Any other error means tool is not accessible
-                return false;
+                fileName += ".exe";
+                directories.Add(AppContext.BaseDirectory);
+                directories.Add(Environment.CurrentDirectory);
+                directories.Add(Environment.SystemDirectory);
+                directories.Add(Environment.GetFolderPath(Environment.SpecialFolder.Windows));
+            }
+
+            var pathVar = Environment.GetEnvironmentVariable("PATH");
+            if (!string.IsNullOrEmpty(pathVar))
+            {
+                // PATH entries on Windows may be quoted
+                directories.AddRange(pathVar.Split(Path.PathSeparator, StringSplitOptions.RemoveEmptyEntries)
+                    .Select(path => path.Trim().Trim('"')));
             }
+
+            return directories
+                .Where(directory => directory.Length > 0)
+                .Select(directory => Path.Combine(directory, fileName))
+                .FirstOrDefault(File.Exists);
         }
 
         /// <summary>
@@ -252,8 +464,8 @@ namespace RTUPointlistParse
         /// </summary>
         private static void DisplayTesseractDiagnostics()
         {
-            Console.WriteLine("  Diagnostic information:");
-            Console.WriteLine("    - Current PATH variable:");
+            LogMessage("  Diagnostic information:");
+            LogMessage("    - Current PATH variable:");
             
             var pathVar = Environment.GetEnvironmentVariable("PATH");
             if (pathVar != null)
@@ -265,32 +477,32 @@ namespace RTUPointlistParse
                 {
                     if (path.Contains("Tesseract", StringComparison.OrdinalIgnoreCase))
                     {
-                        Console.WriteLine($"      Found Tesseract in PATH: {path}");
+                        LogMessage($"      Found Tesseract in PATH: {path}");
                         foundTesseract = true;
                         
                         // Check if tesseract.exe exists in this path
                         var tesseractExe = Path.Combine(path, "tesseract.exe");
                         if (File.Exists(tesseractExe))
                         {
-                            Console.WriteLine($"      ✓ tesseract.exe found at: {tesseractExe}");
+                            LogMessage($"      ✓ tesseract.exe found at: {tesseractExe}");
                         }
                         else
                         {
-                            Console.WriteLine($"      ✗ tesseract.exe NOT found at: {tesseractExe}");
+                            LogMessage($"      ✗ tesseract.exe NOT found at: {tesseractExe}");
                         }
                     }
                 }
                 
                 if (!foundTesseract)
                 {
-                    Console.WriteLine("      No Tesseract directory found in PATH");
+                    LogMessage("      No Tesseract directory found in PATH");
                 }
             }
             
             // Check common installation locations on Windows
             if (OperatingSystem.IsWindows())
             {
-                Console.WriteLine("    - Checking common installation locations:");
+                LogMessage("    - Checking common installation locations:");
                 var commonPaths = new[]
                 {
                     @"C:\Program Files\Tesseract-OCR\tesseract.exe",
@@ -302,9 +514,9 @@ namespace RTUPointlistParse
                 {
                     if (File.Exists(path))
                     {
-                        Console.WriteLine($"      ✓ Found tesseract.exe at: {path}");
-                        Console.WriteLine("      → You may need to restart your terminal/IDE for PATH changes to take effect");
-                        Console.WriteLine("      → Or ensure the directory is in PATH, not just the parent directory");
+                        LogMessage($"      ✓ Found tesseract.exe at: {path}");
+                        LogMessage("      → You may need to restart your terminal/IDE for PATH changes to take effect");
+                        LogMessage("      → Or ensure the directory is in PATH, not just the parent directory");
                     }
                 }
             }
@@ -313,196 +525,520 @@ namespace RTUPointlistParse
         /// <summary>
         /// Extract text from PDF using OCR (for image-based PDFs)
         /// </summary>
-        private static string ExtractTextFromPdfWithOcr(string pdfPath)
+        private static string ExtractTextFromPdfWithOcr(string pdfPath, PdfDocument document)
         {
+            OcrWorkerSlots.Wait();
             try
             {
-                Console.WriteLine($"  Performing OCR on PDF...");
-                
-                // Check if required tools are available
-                if (!IsToolAvailable("pdftoppm"))
+                LogMessage($"  Performing OCR on PDF...");
+
+                // Prefer the in-process Tesseract engine; fall back to the tesseract command line tool
+                var engine = RentTesseractEngine();
+                try
                 {
-                    Console.WriteLine("  ERROR: 'pdftoppm' not found. OCR requires poppler-utils to be installed.");
-                    Console.WriteLine("  Installation instructions:");
-                    Console.WriteLine("    Windows: Download from https://blog.alivate.com.au/poppler-windows/");
-                    Console.WriteLine("             Extract and add the 'bin' folder to your system PATH");
-                    Console.WriteLine("    Linux:   sudo apt-get install poppler-utils");
-                    Console.WriteLine("    macOS:   brew install poppler");
-                    Console.WriteLine("  ");
-                    Console.WriteLine("  TROUBLESHOOTING:");
-                    Console.WriteLine("    - After installing, restart your terminal/IDE/Command Prompt");
-                    Console.WriteLine("    - Verify installation by running: pdftoppm -v");
-                    return string.Empty;
+                    // Scanned PDFs usually hold one image per page - OCR those in memory when possible
+                    // so the pages do not have to be rendered to disk by pdftoppm first
+                    if (engine != null)
+                    {
+                        var pageImages = ExtractScannedPageImages(document);
+                        if (pageImages != null)
+                        {
+                            string text = OcrImagesWithEngine(engine, pageImages);
+                            LogMessage($"  OCR completed on {pageImages.Count} page(s)");
+                            return text;
+                        }
+                    }
+
+                    return OcrRenderedPdfPages(pdfPath, engine);
+                }
+                finally
+                {
+                    if (engine != null)
+                        ReturnTesseractEngine(engine);
                 }
+            }
+            catch (Exception ex)
+            {
+                LogMessage($"  OCR extraction error: {ex.Message}");
+                return string.Empty;
+            }
+            finally
+            {
+                OcrWorkerSlots.Release();
+            }
+        }
+
+        /// <summary>
+        /// Get the embedded image of every page of a scanned PDF as PNG data
+        /// with the rotation and scale that make it match the page as pdftoppm renders it
+        /// Returns null unless each page consists of exactly one image that covers the page,
+        /// is placed without stretching or rotation of its own, and PdfPig can decode
+        /// </summary>
+        private static List<OcrPageImage>? ExtractScannedPageImages(PdfDocument document)
+        {
+            var pageImages = new List<OcrPageImage>();
 
+            foreach (var page in document.GetPages())
+            {
+                var images = page.GetImages().ToList();
+                if (images.Count != 1 || !ImageCoversPage(images[0].Bounds, page.CropBox.Bounds))
+                    return null;
+
+                // Resolution of the scan on the page - if it differs horizontally and vertically
+                // the image is stretched or turned by its placement, which only pdftoppm reproduces
+                var image = images[0];
+                double dpiX = image.WidthInSamples * 72.0 / image.Bounds.Width;
+                double dpiY = image.HeightInSamples * 72.0 / image.Bounds.Height;
+                if (Math.Abs(dpiX - dpiY) > dpiX * PAGE_IMAGE_MATCH_TOLERANCE)
+                    return null;
+
+                if (!image.TryGetPng(out var png))
+                    return null;
+
+                pageImages.Add(new OcrPageImage
+                {
+                    Data = png,
+                    Rotation = page.Rotation.Value,
+                    Scale = (float)(OCR_RENDER_DPI / dpiX)
+                });
+            }
+
+            return pageImages.Count > 0 ? pageImages : null;
+        }
+
+        /// <summary>
+        /// Check that an image is placed over (practically) the whole visible page area
+        /// </summary>
+        private static bool ImageCoversPage(PdfRectangle imageBounds, PdfRectangle pageBounds)
+        {
+            double toleranceX = pageBounds.Width * PAGE_IMAGE_MATCH_TOLERANCE;
+            double toleranceY = pageBounds.Height * PAGE_IMAGE_MATCH_TOLERANCE;
+
+            return Math.Abs(imageBounds.Left - pageBounds.Left) <= toleranceX &&
+                   Math.Abs(imageBounds.Right - pageBounds.Right) <= toleranceX &&
+                   Math.Abs(imageBounds.Bottom - pageBounds.Bottom) <= toleranceY &&
+                   Math.Abs(imageBounds.Top - pageBounds.Top) <= toleranceY;
+        }
+
+        /// <summary>
+        /// Render PDF pages to images with pdftoppm and run OCR on them
+        /// Uses the given engine, or the tesseract command line tool if no engine is available
+        /// </summary>
+        private static string OcrRenderedPdfPages(string pdfPath, TesseractEngine? engine)
+        {
+            // Check if required tools are available
+            if (!IsToolAvailable("pdftoppm"))
+            {
+                LogMessage("  ERROR: 'pdftoppm' not found. OCR requires poppler-utils to be installed.");
+                LogMessage("  Installation instructions:");
+                LogMessage("    Windows: Download from https://blog.alivate.com.au/poppler-windows/");
+                LogMessage("             Extract and add the 'bin' folder to your system PATH");
+                LogMessage("    Linux:   sudo apt-get install poppler-utils");
+                LogMessage("    macOS:   brew install poppler");
+                LogMessage("  ");
+                LogMessage("  TROUBLESHOOTING:");
+                LogMessage("    - After installing, restart your terminal/IDE/Command Prompt");
+                LogMessage("    - Verify installation by running: pdftoppm -v");
+                return string.Empty;
+            }
+
+            if (engine == null)
+            {
                 if (!IsToolAvailable("tesseract"))
                 {
-                    Console.WriteLine("  ERROR: 'tesseract' not found. OCR requires Tesseract OCR to be installed.");
-                    Console.WriteLine("  Installation instructions:");
-                    Console.WriteLine("    Windows: Download from https://github.com/UB-Mannheim/tesseract/wiki");
-                    Console.WriteLine("             Install and ensure it's added to your system PATH");
-                    Console.WriteLine("    Linux:   sudo apt-get install tesseract-ocr");
-                    Console.WriteLine("    macOS:   brew install tesseract");
-                    Console.WriteLine("  ");
-                    Console.WriteLine("  TROUBLESHOOTING:");
-                    Console.WriteLine("    - After installing, restart your terminal/IDE/Command Prompt");
-                    Console.WriteLine("    - Verify installation by running: tesseract --version");
+                    LogMessage("  ERROR: 'tesseract' not found. OCR requires Tesseract OCR to be installed.");
+                    LogMessage("  Installation instructions:");
+                    LogMessage("    Windows: Download from https://github.com/UB-Mannheim/tesseract/wiki");
+                    LogMessage("             Install and ensure it's added to your system PATH");
+                    LogMessage("    Linux:   sudo apt-get install tesseract-ocr");
+                    LogMessage("    macOS:   brew install tesseract");
+                    LogMessage("  ");
+                    LogMessage("  TROUBLESHOOTING:");
+                    LogMessage("    - After installing, restart your terminal/IDE/Command Prompt");
+                    LogMessage("    - Verify installation by running: tesseract --version");
                     DisplayTesseractDiagnostics();
                     return string.Empty;
                 }
+            }
+
+            // Create a temporary directory for image files
+            string tempDir = Path.Combine(Path.GetTempPath(), $"pdf_ocr_{Guid.NewGuid()}");
+            Directory.CreateDirectory(tempDir);
+
+            try
+            {
+                // Convert PDF pages to images using pdftoppm
+                // Grayscale at a fixed resolution - tesseract works on gray images anyway, and
+                // OCR time grows with pixel count, so nothing is rendered that the tables do not need
+                var ppmProcess = new Process
+                {
+                    StartInfo = new ProcessStartInfo
+                    {
+                        FileName = "pdftoppm",
+                        Arguments = $"-png -gray -r {OCR_RENDER_DPI} \"{pdfPath}\" \"{Path.Combine(tempDir, "page")}\"",
+                        RedirectStandardOutput = true,
+                        RedirectStandardError = true,
+                        UseShellExecute = false,
+                        CreateNoWindow = true
+                    }
+                };
+
+                ppmProcess.Start();
+                ppmProcess.WaitForExit();
+
+                if (ppmProcess.ExitCode != 0)
+                {
+                    var error = ppmProcess.StandardError.ReadToEnd();
+                    LogMessage($"  Error converting PDF to images: {error}");
+                    return string.Empty;
+                }
+
+                // Get all generated image files
+                var imageFiles = Directory.GetFiles(tempDir, "*.png").OrderBy(f => f).ToArray();
                 
-                // Create a temporary directory for image files
-                string tempDir = Path.Combine(Path.GetTempPath(), $"pdf_ocr_{Guid.NewGuid()}");
-                Directory.CreateDirectory(tempDir);
+                if (imageFiles.Length == 0)
+                {
+                    LogMessage($"  No images generated from PDF");
+                    return string.Empty;
+                }
+
+                string ocrText = engine != null
+                    ? OcrImagesWithEngine(engine, imageFiles.Select(f => new OcrPageImage { Data = File.ReadAllBytes(f) }).ToList())
+                    : OcrImagesWithTesseractCli(imageFiles, tempDir);
 
+                LogMessage($"  OCR completed on {imageFiles.Length} page(s)");
+                return ocrText;
+            }
+            finally
+            {
+                // Clean up temporary files
                 try
                 {
-                    // Convert PDF pages to images using pdftoppm
-                    var ppmProcess = new Process
-                    {
-                        StartInfo = new ProcessStartInfo
-                        {
-                            FileName = "pdftoppm",
-                            Arguments = $"-png \"{pdfPath}\" \"{Path.Combine(tempDir, "page")}\"",
-                            RedirectStandardOutput = true,
-                            RedirectStandardError = true,
-                            UseShellExecute = false,
-                            CreateNoWindow = true
-                        }
-                    };
+                    Directory.Delete(tempDir, true);
+                }
+                catch
+                {
+                    // Ignore cleanup errors
+                }
+            }
+        }
 
-                    ppmProcess.Start();
-                    ppmProcess.WaitForExit();
+        /// <summary>
+        /// Get an in-process Tesseract engine from the pool, creating one if none is free
+        /// Returns null if the Tesseract native libraries or tessdata cannot be loaded
+        /// </summary>
+        private static TesseractEngine? RentTesseractEngine()
+        {
+            if (TesseractEnginePool.TryTake(out var pooledEngine))
+                return pooledEngine;
 
-                    if (ppmProcess.ExitCode != 0)
-                    {
-                        var error = ppmProcess.StandardError.ReadToEnd();
-                        Console.WriteLine($"  Error converting PDF to images: {error}");
-                        return string.Empty;
-                    }
+            if (tesseractEngineUnavailable)
+                return null;
 
-                    // Get all generated image files
-                    var imageFiles = Directory.GetFiles(tempDir, "*.png").OrderBy(f => f).ToArray();
-                    
-                    if (imageFiles.Length == 0)
-                    {
-                        Console.WriteLine($"  No images generated from PDF");
-                        return string.Empty;
-                    }
+            string? tessdataPath = FindTessdataFolder();
+            if (tessdataPath == null)
+            {
+                tesseractEngineUnavailable = true;
+                return null;
+            }
 
-                    var sb = new StringBuilder();
+            try
+            {
+                // LSTM only with a single uniform text block - the point lists are plain tables,
+                // so the legacy engine and automatic page layout analysis only cost time
+                var engine = new TesseractEngine(tessdataPath, "eng", EngineMode.LstmOnly);
+                engine.DefaultPageSegMode = PageSegMode.SingleBlock;
+                return engine;
+            }
+            catch (Exception ex)
+            {
+                // Typically missing native libraries on this platform
+                tesseractEngineUnavailable = true;
+                LogMessage($"  In-process Tesseract unavailable, using tesseract command line: {ex.Message}");
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Return an engine to the pool so the loaded language model is reused by later PDFs
+        /// </summary>
+        private static void ReturnTesseractEngine(TesseractEngine engine)
+        {
+            TesseractEnginePool.Add(engine);
+        }
+
+        /// <summary>
+        /// Dispose all pooled engines once no more OCR will be run
+        /// </summary>
+        private static void DisposeTesseractEngines()
+        {
+            while (TesseractEnginePool.TryTake(out var engine))
+            {
+                engine.Dispose();
+            }
+        }
+
+        /// <summary>
+        /// Take up to the given number of OCR worker slots that are free right now, without waiting
+        /// The caller must release the returned number of slots when its extra workers are done
+        /// </summary>
+        private static int AcquireExtraOcrWorkers(int maxWorkers)
+        {
+            int acquired = 0;
+            while (acquired < maxWorkers && OcrWorkerSlots.Wait(0))
+            {
+                acquired++;
+            }
+            return acquired;
+        }
+
+        /// <summary>
+        /// Release OCR worker slots taken by AcquireExtraOcrWorkers
+        /// </summary>
+        private static void ReleaseExtraOcrWorkers(int count)
+        {
+            if (count > 0)
+                OcrWorkerSlots.Release(count);
+        }
+
+        /// <summary>
+        /// Find a tessdata folder containing the English language data
+        /// Checks TESSDATA_PREFIX first, then the installed tesseract's own tessdata,
+        /// then the tessdata folder copied next to the executable
+        /// </summary>
+        private static string? FindTessdataFolder()
+        {
+            var candidates = new List<string>();
 
-                    // Perform OCR on each page image
-                    foreach (var imageFile in imageFiles)
+            var prefix = Environment.GetEnvironmentVariable("TESSDATA_PREFIX");
+            if (!string.IsNullOrWhiteSpace(prefix))
+            {
+                candidates.Add(prefix);
+                candidates.Add(Path.Combine(prefix, "tessdata"));
+            }
+
+            // The bundled model is the float "best" LSTM model, which is several times slower than the
+            // integer model of a regular tesseract install - use the installed one when there is one,
+            // so the engine runs the same model as the tesseract command line it replaces
+            var tesseractDirectory = Path.GetDirectoryName(FindToolPath("tesseract"));
+            if (!string.IsNullOrEmpty(tesseractDirectory))
+            {
+                // Windows installer layout, then Unix share folders (e.g. /usr/share/tesseract-ocr/5/tessdata)
+                candidates.Add(Path.Combine(tesseractDirectory, "tessdata"));
+                var shareDirectory = Path.GetFullPath(Path.Combine(tesseractDirectory, "..", "share"));
+                candidates.Add(Path.Combine(shareDirectory, "tessdata"));
+                var versionedShareDirectory = Path.Combine(shareDirectory, "tesseract-ocr");
+                if (Directory.Exists(versionedShareDirectory))
+                {
+                    candidates.AddRange(Directory.GetDirectories(versionedShareDirectory)
+                        .OrderByDescending(dir => dir, StringComparer.Ordinal)
+                        .Select(dir => Path.Combine(dir, "tessdata")));
+                }
+            }
+
+            candidates.Add(Path.Combine(AppContext.BaseDirectory, "tessdata"));
+
+            return candidates.FirstOrDefault(dir => File.Exists(Path.Combine(dir, "eng.traineddata")));
+        }
+
+        /// <summary>
+        /// Run OCR on in-memory page images with an already loaded Tesseract engine
+        /// </summary>
+        private static string OcrImagesWithEngine(TesseractEngine engine, List<OcrPageImage> pageImages)
+        {
+            var pageTexts = new string[pageImages.Count];
+            int extraWorkers = AcquireExtraOcrWorkers(pageImages.Count - 1);
+
+            // An engine is not thread-safe, so each worker gets its own: the caller's engine
+            // plus one more from the pool per extra worker slot
+            var workerEngines = new List<TesseractEngine> { engine };
+            try
+            {
+                while (workerEngines.Count <= extraWorkers)
+                {
+                    var extraEngine = RentTesseractEngine();
+                    if (extraEngine == null)
+                        break;
+                    workerEngines.Add(extraEngine);
+                }
+
+                // Worker w OCRs every page i with i % workerCount == w using only its own engine
+                int workerCount = workerEngines.Count;
+                Parallel.For(0, workerCount, new ParallelOptions { MaxDegreeOfParallelism = workerCount }, w =>
+                {
+                    for (int i = w; i < pageImages.Count; i += workerCount)
                     {
-                        using (var tessProcess = new Process
+                        // A page that cannot be loaded or recognized is left empty, keeping the other pages
+                        try
                         {
-                            StartInfo = new ProcessStartInfo
-                            {
-                                FileName = "tesseract",
-                                Arguments = $"\"{imageFile}\" stdout",
-                                RedirectStandardOutput = true,
-                                RedirectStandardError = true,
-                                UseShellExecute = false,
-                                CreateNoWindow = true
-                            }
-                        })
+                            pageTexts[i] = OcrImageWithEngine(workerEngines[w], pageImages[i]);
+                        }
+                        catch (Exception ex)
                         {
-                            tessProcess.Start();
-                            
-                            // Read output before waiting to avoid deadlock
-                            var text = tessProcess.StandardOutput.ReadToEnd();
-                            var error = tessProcess.StandardError.ReadToEnd();
-                            
-                            tessProcess.WaitForExit();
-
-                            // Only append text if tesseract succeeded
-                            if (tessProcess.ExitCode == 0)
-                            {
-                                sb.AppendLine(text);
-                            }
-                            else
-                            {
-                                Console.WriteLine($"  Tesseract OCR error on {Path.GetFileName(imageFile)}: {error}");
-                            }
+                            LogMessage($"  OCR error on page {i + 1}: {ex.Message}");
+                            pageTexts[i] = string.Empty;
                         }
                     }
+                });
+            }
+            finally
+            {
+                // The caller returns its own engine
+                foreach (var extraEngine in workerEngines.Skip(1))
+                {
+                    ReturnTesseractEngine(extraEngine);
+                }
+                ReleaseExtraOcrWorkers(extraWorkers);
+            }
+
+            var sb = new StringBuilder();
+            foreach (var pageText in pageTexts)
+            {
+                sb.AppendLine(pageText);
+            }
+
+            return sb.ToString();
+        }
 
-                    Console.WriteLine($"  OCR completed on {imageFiles.Length} page(s)");
-                    return sb.ToString();
+        /// <summary>
+        /// Run OCR on a single in-memory page image, scaled and rotated upright first if needed
+        /// </summary>
+        private static string OcrImageWithEngine(TesseractEngine engine, OcrPageImage pageImage)
+        {
+            var image = Pix.LoadFromMemory(pageImage.Data);
+            try
+            {
+                if (Math.Abs(pageImage.Scale - 1f) > PAGE_IMAGE_MATCH_TOLERANCE)
+                    image = ReplacePix(image, image.Scale(pageImage.Scale, pageImage.Scale));
+
+                // Rotation is clockwise in steps of 90 degrees, like the page's /Rotate
+                for (int degrees = 0; degrees < pageImage.Rotation; degrees += 90)
+                {
+                    image = ReplacePix(image, image.Rotate90(1));
                 }
-                finally
+
+                using (var page = engine.Process(image))
                 {
-                    // Clean up temporary files
-                    try
-                    {
-                        Directory.Delete(tempDir, true);
-                    }
-                    catch
-                    {
-                        // Ignore cleanup errors
-                    }
+                    return page.GetText();
                 }
             }
-            catch (Exception ex)
+            finally
             {
-                Console.WriteLine($"  OCR extraction error: {ex.Message}");
-                return string.Empty;
+                image.Dispose();
             }
         }
 
         /// <summary>
-        /// Parse table data from extracted PDF text into structured rows for Status sheet
-        /// Extracts only Point Number and Point Name columns
+        /// Dispose an image that has been replaced by a transformed copy and return the copy
         /// </summary>
-        public static List<TableRow> ParseStatusTable(string pdfText)
+        private static Pix ReplacePix(Pix original, Pix transformed)
         {
-            var rows = new List<TableRow>();
-            var lines = pdfText.Split(new[] { '\r', '\n' }, StringSplitOptions.RemoveEmptyEntries);
-            int pointNumber = 0;
+            original.Dispose();
+            return transformed;
+        }
 
-            foreach (var line in lines)
+        /// <summary>
+        /// Run OCR on page images with the tesseract command line tool
+        /// Pages are split into one contiguous batch per allowed OCR worker and the batches run concurrently
+        /// </summary>
+        private static string OcrImagesWithTesseractCli(string[] imageFiles, string tempDir)
+        {
+            int extraWorkers = AcquireExtraOcrWorkers(imageFiles.Length - 1);
+            try
             {
-                if (string.IsNullOrWhiteSpace(line))
-                    continue;
+                int parallelism = 1 + extraWorkers;
+                if (parallelism <= 1)
+                    return OcrImageBatchWithTesseractCli(imageFiles, Path.Combine(tempDir, "list.txt"), pdfsProcessedConcurrently);
 
-                var trimmedLine = line.Trim();
+                int batchSize = (imageFiles.Length + parallelism - 1) / parallelism;
+                var batches = imageFiles.Chunk(batchSize).ToArray();
+                var batchTexts = new string[batches.Length];
 
-                // Skip metadata and header lines
-                if (IsMetadataOrHeaderLine(trimmedLine))
-                    continue;
+                Parallel.For(0, batches.Length, i =>
+                {
+                    batchTexts[i] = OcrImageBatchWithTesseractCli(batches[i], Path.Combine(tempDir, $"list{i}.txt"), true);
+                });
+
+                return string.Concat(batchTexts);
+            }
+            finally
+            {
+                ReleaseExtraOcrWorkers(extraWorkers);
+            }
+        }
 
-                // Split two-column layout if present
-                // PDFs may have two columns side-by-side that OCR reads as one line
-                // Look for pattern like: "... 80 | POINT_NAME ..." which indicates second column start
-                var columnLines = SplitTwoColumnLayout(trimmedLine);
+        /// <summary>
+        /// Run OCR on page images with a single tesseract invocation
+        /// The image paths are passed as a list file so the language model is loaded once for all pages
+        /// </summary>
+        private static string OcrImageBatchWithTesseractCli(string[] imageFiles, string listFile, bool limitThreads)
+        {
+            File.WriteAllLines(listFile, imageFiles.Select(Path.GetFullPath));
 
-                foreach (var columnLine in columnLines)
+            string error;
+            using (var tessProcess = new Process
+            {
+                StartInfo = new ProcessStartInfo
                 {
-                    if (string.IsNullOrWhiteSpace(columnLine))
-                        continue;
+                    FileName = "tesseract",
+                    Arguments = $"\"{listFile}\" stdout -l eng --oem 1 --psm 6",
+                    RedirectStandardOutput = true,
+                    RedirectStandardError = true,
+                    UseShellExecute = false,
+                    CreateNoWindow = true
+                }
+            })
+            {
+                // Several tesseract processes share the CPU - stop each one from also starting
+                // an OpenMP thread per core, which oversubscribes the machine and slows all of them
+                if (limitThreads)
+                    tessProcess.StartInfo.Environment["OMP_THREAD_LIMIT"] = "1";
 
-                    // Check if this looks like a data row (starts with number followed by | or [)
-                    if (DataRowPattern.IsMatch(columnLine))
-                    {
-                        // Parse this as a status data row - extract only Point Number and Point Name
-                        var parsedRow = ParseSimpleDataRow(columnLine, pointNumber);
-                        if (parsedRow != null)
-                        {
-                            string pointName = parsedRow.Columns.Count > 1 ? parsedRow.Columns[1] : "";
-                            
-                            // Filter out empty rows and rows where Point Name contains "Spare"
-                            if (IsValidPointName(pointName))
-                            {
-                                rows.Add(parsedRow);
-                                pointNumber++;
-                            }
-                        }
-                    }
+                tessProcess.Start();
+
+                // Read both streams concurrently - tesseract reports per-page progress on stderr
+                var errorTask = tessProcess.StandardError.ReadToEndAsync();
+                var text = tessProcess.StandardOutput.ReadToEnd();
+                error = errorTask.Result;
+
+                tessProcess.WaitForExit();
+
+                if (tessProcess.ExitCode == 0)
+                    return text;
+            }
+
+            // In list mode tesseract stops at the first page it cannot read, so run the pages one at a time
+            // to keep the text of the others
+            if (imageFiles.Length > 1)
+            {
+                LogMessage($"  Tesseract OCR error, retrying {imageFiles.Length} page(s) one at a time: {error}");
+                var sb = new StringBuilder();
+                foreach (var imageFile in imageFiles)
+                {
+                    sb.Append(OcrImageBatchWithTesseractCli(new[] { imageFile }, listFile, limitThreads));
                 }
+                return sb.ToString();
             }
 
-            return rows;
+            LogMessage($"  Tesseract OCR error on {Path.GetFileName(imageFiles[0])}: {error}");
+            return string.Empty;
+        }
+
+        /// <summary>
+        /// Parse table data from extracted PDF text into structured rows for Status sheet
+        /// Extracts only Point Number and Point Name columns
+        /// </summary>
+        public static List<TableRow> ParseStatusTable(string pdfText)
+        {
+            return ParseStatusTable(new[] { pdfText });
+        }
+
+        /// <summary>
+        /// Parse table data from extracted PDF text chunks (e.g. pages) into structured rows for Status sheet
+        /// </summary>
+        public static List<TableRow> ParseStatusTable(IEnumerable<string> textChunks)
+        {
+            return ParsePointTable(textChunks);
         }
 
         /// <summary>
@@ -510,44 +1046,68 @@ namespace RTUPointlistParse
         /// Extracts only Point Number and Point Name columns
         /// </summary>
         public static List<TableRow> ParseAnalogTable(string pdfText)
+        {
+            return ParseAnalogTable(new[] { pdfText });
+        }
+
+        /// <summary>
+        /// Parse table data from extracted PDF text chunks (e.g. pages) into structured rows for Analog sheet
+        /// </summary>
+        public static List<TableRow> ParseAnalogTable(IEnumerable<string> textChunks)
+        {
+            return ParsePointTable(textChunks);
+        }
+
+        /// <summary>
+        /// Parse Point Number and Point Name rows from text chunks
+        /// Status and Analog point lists share the same row layout for these two columns
+        /// </summary>
+        private static List<TableRow> ParsePointTable(IEnumerable<string> textChunks)
         {
             var rows = new List<TableRow>();
-            var lines = pdfText.Split(new[] { '\r', '\n' }, StringSplitOptions.RemoveEmptyEntries);
             int pointNumber = 0;
 
-            foreach (var line in lines)
+            // Parse one chunk (page) at a time so no joined copy of the document is needed
+            foreach (var textChunk in textChunks)
             {
-                if (string.IsNullOrWhiteSpace(line))
-                    continue;
-
-                var trimmedLine = line.Trim();
-
-                // Skip metadata and header lines
-                if (IsMetadataOrHeaderLine(trimmedLine))
-                    continue;
+                // Walk the lines as spans so blank and short lines are skipped without allocating a string
+                foreach (var line in textChunk.AsSpan().EnumerateLines())
+                {
+                    var trimmedSpan = line.Trim();
+                    if (trimmedSpan.Length < MIN_LINE_LENGTH)
+                        continue;
 
-                // Split two-column layout if present
-                var columnLines = SplitTwoColumnLayout(trimmedLine);
+                    var trimmedLine = trimmedSpan.ToString();
 
-                foreach (var columnLine in columnLines)
-                {
-                    if (string.IsNullOrWhiteSpace(columnLine))
+                    // Skip metadata and header lines
+                    if (IsMetadataOrHeaderLine(trimmedLine))
                         continue;
 
-                    // Check if this looks like a data row
-                    if (DataRowPattern.IsMatch(columnLine))
+                    // Split two-column layout if present
+                    // PDFs may have two columns side-by-side that OCR reads as one line
+                    // Look for pattern like: "... 80 | POINT_NAME ..." which indicates second column start
+                    var columnLines = SplitTwoColumnLayout(trimmedLine);
+
+                    foreach (var columnLine in columnLines)
                     {
-                        // Parse this as an analog data row - extract only Point Number and Point Name
-                        var parsedRow = ParseSimpleDataRow(columnLine, pointNumber);
-                        if (parsedRow != null)
+                        if (string.IsNullOrWhiteSpace(columnLine))
+                            continue;
+
+                        // Check if this looks like a data row (starts with number followed by | or [)
+                        if (DataRowPattern.IsMatch(columnLine))
                         {
-                            string pointName = parsedRow.Columns.Count > 1 ? parsedRow.Columns[1] : "";
-                            
-                            // Filter out empty rows and rows where Point Name contains "Spare"
-                            if (IsValidPointName(pointName))
+                            // Parse this as a data row - extract only Point Number and Point Name
+                            var parsedRow = ParseSimpleDataRow(columnLine, pointNumber);
+                            if (parsedRow != null)
                             {
-                                rows.Add(parsedRow);
-                                pointNumber++;
+                                string pointName = parsedRow.Columns.Count > 1 ? parsedRow.Columns[1] : "";
+                            
+                                // Filter out empty rows and rows where Point Name contains "Spare"
+                                if (IsValidPointName(pointName))
+                                {
+                                    rows.Add(parsedRow);
+                                    pointNumber++;
+                                }
                             }
                         }
                     }
@@ -626,6 +1186,12 @@ namespace RTUPointlistParse
         /// <returns>True if the point name is valid, false otherwise</returns>
         private static bool IsValidPointName(string pointName)
         {
+            // Cheapest checks first - most rejected names are empty or short OCR artifacts
+            // Filter out single characters or very short OCR artifacts
+            // (this also covers every entry in OcrNoisePatterns, e.g. "I", "DI", "or")
+            if (pointName == null || pointName.Length <= 2)
+                return false;
+
             if (string.IsNullOrWhiteSpace(pointName))
                 return false;
             
@@ -633,20 +1199,8 @@ namespace RTUPointlistParse
             if (pointName.Contains("SPARE", StringComparison.OrdinalIgnoreCase))
                 return false;
             
-            // Filter out single characters or very short OCR artifacts
-            if (pointName.Length <= 2)
-                return false;
-            
-            // Filter out common OCR noise patterns
-            if (pointName == "I" || pointName == "F" || pointName == "J" || pointName == "L" ||
-                pointName == "—" || pointName == "=" || pointName == "DI" || pointName == "or")
-                return false;
-            
             // Filter out reference/metadata lines
-            if (pointName.Contains("LISTING") || pointName.Contains("CONSTRUCTION") || 
-                pointName.Contains("ADDED POINT") || pointName.Contains("SYSTEM") ||
-                pointName.Contains("REFERENCE") || pointName.Contains("SAP") ||
-                pointName.Contains("PLOT BY") || pointName.StartsWith("RESERVED FOR"))
+            if (MetadataPointNamePattern.IsMatch(pointName))
                 return false;
             
             return true;
@@ -657,11 +1211,21 @@ namespace RTUPointlistParse
         /// </summary>
         private static bool IsMetadataOrHeaderLine(string line)
         {
+            // Skip lines that are very short (cheapest check, rejects most OCR noise)
+            if (line.Length < MIN_LINE_LENGTH)
+            {
+                return true;
+            }
+
+            // Skip lines that are clearly metadata or header rows, matched with a single scan
+            if (MetadataLinePattern.IsMatch(line))
+            {
+                return true;
+            }
+
             // Skip lines that are clearly metadata
-            if (line.Contains("PLOT BY:") || line.Contains("_PROJECTS\\") ||
-                line.Contains(".dwg") || line.Contains("DIAG") ||
-                line.StartsWith("i ") || line.StartsWith("a ") ||
-                (line.Contains("—") && line.Length < 20) ||
+            if (line.StartsWith("i ", StringComparison.Ordinal) || line.StartsWith("a ", StringComparison.Ordinal) ||
+                (line.Length < 20 && line.Contains('—')) ||
                 (line.Contains("NOTE") && line.Contains("ADDED POINT")))
             {
                 return true;
@@ -670,14 +1234,13 @@ namespace RTUPointlistParse
             // Skip header rows (contain mostly column titles without data)
             if ((line.Contains("POINT NAME") && line.Contains("STATE")) ||
                 (line.Contains("DEC") && line.Contains("DSCRPT")) ||
-                (line.Contains("COEFFICIENT") && line.Contains("OFFSET")) ||
-                line.Contains("INTERPOSNG") || line.Contains("RELAY NO."))
+                (line.Contains("COEFFICIENT") && line.Contains("OFFSET")))
             {
                 return true;
             }
 
-            // Skip lines that are just separators or very short
-            if (line.Length < 10 || line.All(c => char.IsWhiteSpace(c) || c == '—' || c == '=' || c == '|'))
+            // Skip lines that are just separators
+            if (line.All(c => char.IsWhiteSpace(c) || c == '—' || c == '=' || c == '|'))
             {
                 return true;
             }
@@ -699,13 +1262,8 @@ namespace RTUPointlistParse
 
                 string remainder = match.Groups[2].Value;
 
-                // Split by | to separate sections
-                var sections = remainder.Split('|');
-                if (sections.Length < 1)
-                    return null;
-
-                // First section contains the point name
-                string firstSection = sections[0].Trim();
+                // First section (text before the first |) contains the point name
+                string firstSection = GetFirstSection(remainder);
 
                 // Extract point name (everything before certain keywords)
                 string pointName = ExtractPointName(firstSection);
@@ -723,11 +1281,20 @@ namespace RTUPointlistParse
             }
             catch (Exception ex)
             {
-                Console.WriteLine($"  Warning: Failed to parse row: {ex.Message}");
+                LogMessage($"  Warning: Failed to parse row: {ex.Message}");
                 return null;
             }
         }
 
+        /// <summary>
+        /// Get the trimmed text before the first | separator without splitting the whole remainder
+        /// </summary>
+        private static string GetFirstSection(string remainder)
+        {
+            int separatorIndex = remainder.IndexOf('|');
+            return (separatorIndex >= 0 ? remainder.Substring(0, separatorIndex) : remainder).Trim();
+        }
+
         /// <summary>
         /// Parse a Status data row from OCR text
         /// Expected columns: TAB, CONTROL_ADDR, POINT_NAME, NORMAL_STATE, 1_STATE, 0_STATE, AOR, DOG_1, DOG_2, EMS_TP, VOLTAGE_BASE, ...
@@ -783,7 +1350,7 @@ namespace RTUPointlistParse
             }
             catch (Exception ex)
             {
-                Console.WriteLine($"  Warning: Failed to parse status row: {ex.Message}");
+                LogMessage($"  Warning: Failed to parse status row: {ex.Message}");
                 return null;
             }
         }
@@ -801,11 +1368,7 @@ namespace RTUPointlistParse
                     return null;
 
                 string remainder = match.Groups[2].Value;
-                var sections = remainder.Split('|');
-                if (sections.Length < 1)
-                    return null;
-
-                string firstSection = sections[0].Trim();
+                string firstSection = GetFirstSection(remainder);
 
                 // Extract point name
                 string pointName = ExtractPointName(firstSection);
@@ -832,7 +1395,7 @@ namespace RTUPointlistParse
             }
             catch (Exception ex)
             {
-                Console.WriteLine($"  Warning: Failed to parse analog row: {ex.Message}");
+                LogMessage($"  Warning: Failed to parse analog row: {ex.Message}");
                 return null;
             }
         }
@@ -846,7 +1409,7 @@ namespace RTUPointlistParse
             // Common patterns: "NAME 115KV CB", "NAME SWITCH", etc.
             // Stop at: numbers followed by state keywords, certain characters like [, (
 
-            var tokens = text.Split(new[] { ' ', '\t' }, StringSplitOptions.RemoveEmptyEntries);
+            var tokens = text.Split(TokenSeparators, StringSplitOptions.RemoveEmptyEntries);
             var nameTokens = new List<string>();
             bool hasSeenMainContent = false;
             bool justSawNo = false;
@@ -855,11 +1418,7 @@ namespace RTUPointlistParse
             foreach (var token in tokens)
             {
                 // Stop collecting if we hit state keywords or control markers
-                if (token == "CLOSE" || token == "OPEN" || token == "NORMAL" || token == "ALARM" ||
-                    token == "AUTO" || token == "SOLID" || token == "MANUAL" || token == "auto" ||
-                    token.Contains("95-") || token.Contains("/AT") || token == "[or" || token == "[ot" ||
-                    token == "[pI" || token == "[oI" || token == "[dI" || token == "DI" || token.Contains("RK") ||
-                    token == "[" || token == "]" || token == "=" || token == "—")
+                if (PointNameStopTokens.Contains(token) || PointNameStopMarkerPattern.IsMatch(token))
                 {
                     break;
                 }
@@ -873,10 +1432,13 @@ namespace RTUPointlistParse
                     continue;
                 }
 
+                // Parse once - the number checks below all look at the same value
+                bool isNumber = int.TryParse(cleaned, out int number);
+
                 // Special case: allow numbers after "NO." or "BANK" (e.g., "NO. 1 BANK", "NO. 3 BANK")
                 if (justSawNo || justSawBank)
                 {
-                    if (int.TryParse(cleaned, out int num) && num >= 0 && num <= 10)
+                    if (isNumber && number >= 0 && number <= 10)
                     {
                         nameTokens.Add(cleaned);
                         justSawNo = false;
@@ -887,17 +1449,17 @@ namespace RTUPointlistParse
                 }
 
                 // Skip standalone single-digit or two-digit numbers that appear after we've collected some content
-                if (hasSeenMainContent && int.TryParse(cleaned, out int numVal))
+                if (hasSeenMainContent && isNumber)
                 {
                     // If this is a small standalone number and we already have content, stop
-                    if (cleaned.Length <= 2 && numVal < 200)
+                    if (cleaned.Length <= 2 && number < 200)
                     {
                         break;
                     }
                 }
 
                 // Skip tokens that are just numbers (unless part of a name like "NO. 1")
-                if (int.TryParse(cleaned, out _) && !justSawNo && !justSawBank && 
+                if (isNumber && !justSawNo && !justSawBank && 
                     !nameTokens.Contains("NO.") && !nameTokens.Contains("PLANT"))
                 {
                     // Allow small numbers that might be part of names only if we don't have content yet
@@ -931,7 +1493,7 @@ namespace RTUPointlistParse
             result = WhitespaceNormalizePattern.Replace(result, " ");  // Normalize whitespace
             
             // Remove trailing single letters that are OCR artifacts (like "I", "F", "J")
-            result = System.Text.RegularExpressions.Regex.Replace(result, @"\s+[A-Z]$", "").Trim();
+            result = TrailingSingleLetterPattern.Replace(result, "").Trim();
             
             return result;
         }
@@ -942,17 +1504,7 @@ namespace RTUPointlistParse
         private static string CleanOCRArtifacts(string token)
         {
             // Common OCR artifacts
-            string cleaned = token
-                .Replace("[f", "")
-                .Replace("||", "")
-                .Replace("|", "")
-                .Replace("[", "")
-                .Replace("]", "")
-                .Replace("(", "")
-                .Replace(")", "")
-                .Replace("{", "")
-                .Replace("}", "")
-                .Replace("_", " ")
+            string cleaned = RemoveOcrSeparatorChars(token)
                 .Replace("  ", " ")
                 .Trim();
 
@@ -998,6 +1550,47 @@ namespace RTUPointlistParse
             return cleaned.Trim();
         }
 
+        /// <summary>
+        /// Remove "[f", |, [, ], (, ), {, } from a token and turn _ into a space in a single pass
+        /// Returns the token itself when it contains none of these characters
+        /// </summary>
+        private static string RemoveOcrSeparatorChars(string token)
+        {
+            if (token.IndexOfAny(OcrSeparatorChars) < 0)
+                return token;
+
+            Span<char> buffer = token.Length <= 256 ? stackalloc char[token.Length] : new char[token.Length];
+            int length = 0;
+
+            for (int i = 0; i < token.Length; i++)
+            {
+                char c = token[i];
+                switch (c)
+                {
+                    case '[':
+                        // "[f" is a common OCR artifact - drop the f along with the bracket
+                        if (i + 1 < token.Length && token[i + 1] == 'f')
+                            i++;
+                        break;
+                    case '|':
+                    case ']':
+                    case '(':
+                    case ')':
+                    case '{':
+                    case '}':
+                        break;
+                    case '_':
+                        buffer[length++] = ' ';
+                        break;
+                    default:
+                        buffer[length++] = c;
+                        break;
+                }
+            }
+
+            return new string(buffer.Slice(0, length));
+        }
+
         /// <summary>
         /// Extract control address (small number after point name)
         /// </summary>
@@ -1012,7 +1605,7 @@ namespace RTUPointlistParse
                     return "";
 
                 string afterName = text.Substring(startPos + pointName.Length).Trim();
-                var tokens = afterName.Split(new[] { ' ', '\t' }, StringSplitOptions.RemoveEmptyEntries);
+                var tokens = afterName.Split(TokenSeparators, StringSplitOptions.RemoveEmptyEntries);
 
                 foreach (var token in tokens.Take(3)) // Check first few tokens after name
                 {
@@ -1025,7 +1618,7 @@ namespace RTUPointlistParse
             }
             catch (Exception ex)
             {
-                Console.WriteLine($"  Warning: Failed to extract control address: {ex.Message}");
+                LogMessage($"  Warning: Failed to extract control address: {ex.Message}");
             }
 
             return "";
@@ -1121,54 +1714,32 @@ namespace RTUPointlistParse
             {
                 // Create Status sheet
                 var statusSheet = workbook.Worksheets.Add("Status");
-                CreateStatusSheet(statusSheet, statusRows);
+                CreatePointSheet(statusSheet, statusRows);
 
                 // Create Analog sheet
                 var analogSheet = workbook.Worksheets.Add("Analog");
-                CreateAnalogSheet(analogSheet, analogRows);
+                CreatePointSheet(analogSheet, analogRows);
 
                 workbook.SaveAs(outputPath);
             }
         }
 
-        private static void CreateStatusSheet(IXLWorksheet worksheet, List<TableRow> rows)
+        /// <summary>
+        /// Write the Point Number / Point Name header and data rows to a worksheet
+        /// </summary>
+        private static void CreatePointSheet(IXLWorksheet worksheet, List<TableRow> rows)
         {
             // Add simple header
             worksheet.Cell(1, 1).Value = "Point Number";
-            worksheet.Cell(1, 1).Style.Font.Bold = true;
             worksheet.Cell(1, 2).Value = "Point Name";
-            worksheet.Cell(1, 2).Style.Font.Bold = true;
+            worksheet.Range(1, 1, 1, 2).Style.Font.Bold = true;
 
-            // Add data rows
-            int currentRow = 2;
-            foreach (var row in rows)
-            {
-                for (int i = 0; i < Math.Min(row.Columns.Count, 2); i++)
-                {
-                    worksheet.Cell(currentRow, i + 1).Value = row.Columns[i];
-                }
-                currentRow++;
-            }
-        }
-
-        private static void CreateAnalogSheet(IXLWorksheet worksheet, List<TableRow> rows)
-        {
-            // Add simple header
-            worksheet.Cell(1, 1).Value = "Point Number";
-            worksheet.Cell(1, 1).Style.Font.Bold = true;
-            worksheet.Cell(1, 2).Value = "Point Name";
-            worksheet.Cell(1, 2).Style.Font.Bold = true;
+            if (rows.Count == 0)
+                return;
 
-            // Add data rows
-            int currentRow = 2;
-            foreach (var row in rows)
-            {
-                for (int i = 0; i < Math.Min(row.Columns.Count, 2); i++)
-                {
-                    worksheet.Cell(currentRow, i + 1).Value = row.Columns[i];
-                }
-                currentRow++;
-            }
+            // Add data rows in a single bulk insert rather than one cell at a time
+            var data = rows.Select(row => row.Columns.Take(2).ToArray());
+            worksheet.Cell(2, 1).InsertData(data);
         }
 
         private static void CompareOutputFiles(string generatedFolder, string expectedFolder)
@@ -1285,4 +1856,37 @@ namespace RTUPointlistParse
     {
         public List<string> Columns { get; set; } = new List<string>();
     }
+
+    /// <summary>
+    /// Point list sheet a PDF file is parsed into
+    /// </summary>
+    public enum SheetType
+    {
+        Status,
+        Analog
+    }
+
+    /// <summary>
+    /// Page image to OCR, with the clockwise rotation and scale that make it match the rendered page
+    /// </summary>
+    public class OcrPageImage
+    {
+        public byte[] Data { get; set; } = Array.Empty<byte>();
+        public int Rotation { get; set; }
+        public float Scale { get; set; } = 1f;
+    }
+
+    /// <summary>
+    /// Outcome of processing a single PDF file
+    /// </summary>
+    public class PdfParseResult
+    {
+        public string FileName { get; set; } = "";
+        public SheetType SheetType { get; set; } = SheetType.Status;
+        public bool IsSheetTypeAssumed { get; set; }
+        public bool HasText { get; set; }
+        public List<TableRow> Rows { get; set; } = new List<TableRow>();
+        public List<string> Messages { get; set; } = new List<string>();
+        public string? Error { get; set; }
+    }
 }